@@ -1,10 +1,19 @@
 import json
+import sys
 
 import pyperclip
 from common.config import DICTIONARY_PATH
 from corpora_manager import CorporaManager
 from common.util import Util
 
+# Optional trie backend for the key index: shares word prefixes, so
+# membership tests avoid hashing and the key set stays compact. Lookups
+# fall back to the plain dict when the package is not installed.
+try:
+    import marisa_trie
+except ImportError:
+    marisa_trie = None
+
 
 class Dictionary:
     """
@@ -36,6 +45,7 @@ class Dictionary:
         self.excluded_words = excluded_words
         self.pi_dictionary = self.load_pi_dictionary(excluded_words)
         self.corpora_manager = CorporaManager(self.pi_dictionary)
+        self._build_key_index()
 
     def load_pi_dictionary(self, excluded_list=None):
         """
@@ -57,7 +67,25 @@ class Dictionary:
             for word in excluded_list:
                 dictionary.pop(word, None)
 
-        return dictionary
+        # Intern the keys so hot lookups hit the pointer-equality fast
+        # path of the dict instead of comparing strings byte by byte
+        return {sys.intern(word): entry for word, entry in dictionary.items()}
+
+    def _build_key_index(self):
+        """
+        Builds a trie-backed index over the dictionary words when the optional 'marisa_trie' package is
+        available, with a parallel list of entry records keyed by trie id. Rebuilt whenever the dictionary
+        is reloaded or an entry is added or edited; without the package the index stays disabled and
+        lookups go through the plain dict.
+        """
+        if marisa_trie is None:
+            self._key_trie = None
+            self._key_values = None
+            return
+        self._key_trie = marisa_trie.Trie(self.pi_dictionary.keys())
+        self._key_values = [None] * len(self._key_trie)
+        for word, entry in self.pi_dictionary.items():
+            self._key_values[self._key_trie[word]] = entry
 
     def get_entry(self, word):
         """
@@ -69,6 +97,11 @@ class Dictionary:
         Returns:
             dict or None: The dictionary entry if found, otherwise None.
         """
+        if self._key_trie is not None:
+            key_id = self._key_trie.get(word)
+            if key_id is None:
+                return None
+            return self._key_values[key_id]
         if word in self.pi_dictionary:
             return self.pi_dictionary[word]
         return None
@@ -102,6 +135,7 @@ class Dictionary:
         if new_entry and new_entry != '':
             self.corpora_manager.edit_corpus_row_and_update_dict(
                 new_entry, new=True)
+            self._build_key_index()
             Util.print_("Entry added successfully.")
             return True
         else:
@@ -162,6 +196,7 @@ class Dictionary:
         # Update the dictionary entry
         if new_entry and new_entry != current_corpus_row:
             self.corpora_manager.edit_corpus_row_and_update_dict(new_entry)
+            self._build_key_index()
             Util.print_("Entry updated successfully.")
             return True
         else:
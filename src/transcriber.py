@@ -1,3 +1,6 @@
+import functools
+import sys
+
 import regex as re
 
 from common.messages import Messages
@@ -12,6 +15,62 @@ class Transcriber:
     conform to the PI Scaffold-Spelling rules, offering both automated and interactive transcription modes.
     """
 
+    # Set to False to split sentences with the original lookbehind-based
+    # regex, kept for parity checking against the forward scanner
+    USE_FAST_SPLIT = True
+
+    # Patterns used on every call are compiled once at class creation
+    _WORD_RE = re.compile(r'[\p{L}\p{M}]+', re.UNICODE)
+    _NON_WORD_RE = re.compile(r'\W')
+    _SENTENCE_SPLIT_RE = re.compile(
+        r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!|\n)\s')
+    _LEADING_MARKS_RE = re.compile(r'^[+#*\s-]+')
+
+    # Classification table for the ASCII fast path of
+    # split_sentence_into_words: every non-letter code point becomes a
+    # space, so a plain translate-and-split yields the same words as
+    # _WORD_RE without entering the regex engine
+    _ASCII_WORD_TABLE = {code: ' ' for code in range(128)
+                         if not chr(code).isalpha()}
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile_word_pattern(word, ignore_case=False):
+        """
+        Compiles (and caches) a whole-word pattern for the given word.
+
+        Args:
+            word (str): The word to build the pattern for.
+            ignore_case (bool): Whether the pattern should be case-insensitive.
+
+        Returns:
+            Pattern: The compiled whole-word pattern.
+        """
+        flags = re.IGNORECASE if ignore_case else 0
+        return re.compile(rf'\b{re.escape(word)}\b', flags)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _match_case(word, replacement):
+        """
+        Applies the casing of the original word to the replacement.
+
+        Results are cached: the same (word, replacement) pairs repeat heavily in real text
+        (e.g. 'The' / 'the' / 'THE'), so common words resolve with a single dict probe.
+
+        Args:
+            word (str): The original word whose casing is preserved.
+            replacement (str): The replacement to recase.
+
+        Returns:
+            str: The replacement with the original word's casing applied.
+        """
+        if word.isupper():
+            return replacement.upper()
+        if word[0].isupper():
+            return replacement[0].upper() + replacement[1:]
+        return replacement
+
     def __init__(self, variation: Variation, perform_preliminary_replacements=False):
         """
         Initializes the Transcriber instance with necessary settings for transcription.
@@ -24,95 +83,178 @@ class Transcriber:
 
         self.performed_preliminar_replacements = perform_preliminary_replacements
         self.preliminary_replacements: dict[str, str] = {}
+        self.preliminary_pattern = None
         self.dictionary: Dictionary
         if perform_preliminary_replacements:
             self.preliminary_replacements = variation.get_dict()
             self.dictionary = Dictionary(self.preliminary_replacements)
+            # Compile a single union pattern so the whole replacement set is
+            # applied in one pass over the text instead of one pass per word
+            keys = sorted(self.preliminary_replacements,
+                          key=len, reverse=True)
+            self.preliminary_pattern = re.compile(
+                r'\b(' + '|'.join(re.escape(key) for key in keys) + r')\b',
+                re.IGNORECASE)
         else:
             self.dictionary = Dictionary()
 
+        # Word-to-replacement maps and the matching union patterns derived
+        # from the PI dictionary, built once per variation and invalidated
+        # on refresh_dictionary
+        self._variation_maps: dict[str, dict] = {}
+        self._variation_patterns: dict[str, re.Pattern] = {}
+
+        # Transcription closure specialized for this instance's variation,
+        # built lazily and discarded on refresh_dictionary
+        self._specialized_transcribe = None
+
+        # Word lists of the sentences being transcribed interactively,
+        # keyed by sentence index and invalidated when a sentence mutates
+        self._words_cache: dict[int, list[str]] = {}
+
+        # Inverted index of lowercase word -> indices of the sentences
+        # containing it, built per interactive session
+        self._word_index: dict[str, set[int]] | None = None
+
         self.pi_entry = None
         self.current_sentence_index = 0
         self.selected_word_index = 0
 
-    def refresh_dictionary(self):
+    def refresh_dictionary(self, word=None):
         """
         Reloads the PI dictionary to reflect the latest updates or modifications.
+
+        When a word is given, the corpus edit has already patched the in-memory entry in place
+        (CorporaManager mutates the loaded dictionary directly), so only the caches derived for that
+        word are updated instead of reconstructing the whole Dictionary from disk.
+
+        Args:
+            word (str, optional): The lowercase word whose entry was just added or edited.
         """
+        if word is not None and self.dictionary.get_entry(word):
+            self._patch_caches_for_word(word)
+            Util.print_("Dictionary entry refreshed successfully.")
+            return
+
         if self.performed_preliminar_replacements:
             self.dictionary = Dictionary(self.preliminary_replacements)
         else:
             self.dictionary = Dictionary()
+        self._variation_maps.clear()
+        self._variation_patterns.clear()
+        self._specialized_transcribe = None
         Util.print_("Dictionary refreshed successfully.")
 
-    def replace_words_for_pi_variation(self, input_text: int, pi_dictionary):
+    def _patch_caches_for_word(self, word):
         """
-        Transforms the input text according to the chosen PI variation by replacing words based on dictionary entries.
+        Updates the cached variation maps for a single edited word and invalidates only what the edit
+        makes stale: a union pattern is dropped just when the word enters or leaves its variation's
+        key set, and the specialized closure is rebuilt lazily from the patched caches.
 
         Args:
-            input_text (str): The text to be transformed.
-            pi_dictionary (Dictionary): The dictionary containing PI entries.
-
-        Returns:
-            str: The transformed text with applied PI variations.
+            word (str): The lowercase word whose dictionary entry changed.
         """
-        # Build a dictionary for replacements
-        replacement_dict = {word: pi_dictionary[word]["PI"][self.variation]
-                            for word in pi_dictionary
-                            if pi_dictionary[word]["PI"][self.variation]}
+        entry_variations = self.dictionary.pi_dictionary[word]["PI"]
+        for variation, replacement_dict in self._variation_maps.items():
+            replacement = entry_variations.get(variation)
+            had_word = word in replacement_dict
+            if replacement:
+                replacement_dict[sys.intern(word)] = replacement
+            else:
+                replacement_dict.pop(word, None)
+            if had_word != bool(replacement):
+                # The key set changed, so this union pattern is stale
+                self._variation_patterns.pop(variation, None)
+        self._specialized_transcribe = None
 
-        # Function to replace a single word
-        def replace_word(word):
-            lower_word = word.lower()
-            if lower_word in replacement_dict:
-                replacement = replacement_dict[lower_word]
-                # Preserve case of the original word
-                if word.isupper():
-                    return replacement.upper()
-                elif word[0].isupper():
-                    return replacement[0].upper() + replacement[1:]
-                return replacement
-            return word
+    def _get_variation_map(self, variation):
+        """
+        Returns the word-to-replacement map for the given variation, building it from the PI dictionary
+        on first use and serving the cached map afterwards. The cache is cleared by refresh_dictionary.
 
-        tokens = re.findall(r'\w+|[^\w\s]+|\s+', input_text)  # type: ignore
-        updated_tokens = [replace_word(
-            token) if token.strip() != '' else token for token in tokens]
-        return ''.join(updated_tokens)
+        Args:
+            variation (str): The chosen PI variation.
 
-    def transform_words_with_s_suffix(self, input_text, pi_dictionary, variation):
+        Returns:
+            dict: A map of lowercase words to their PI replacements.
+        """
+        replacement_dict = self._variation_maps.get(variation)
+        if replacement_dict is None:
+            pi_dictionary = self.dictionary.pi_dictionary
+            replacement_dict = {word: pi_dictionary[word]["PI"][variation]
+                                for word in pi_dictionary
+                                if pi_dictionary[word]["PI"][variation]}
+            self._variation_maps[variation] = replacement_dict
+        return replacement_dict
+
+    def _get_variation_pattern(self, variation):
         """
-        Handles the transformation of words ending in 's', applying specific PI rules for these cases.
+        Returns the compiled union pattern matching every word of the given variation's replacement map,
+        plus an optional 's' suffix for the plural fallback. Built on first use and cached alongside the map.
 
         Args:
-            input_text (str): The text to be processed.
-            pi_dictionary (Dictionary): The dictionary containing PI entries.
             variation (str): The chosen PI variation.
 
         Returns:
-            str: The text with transformed 's' suffix words.
-        """
-        # Function to transform a word with 's' suffix
-        def transform_word(word):
-            if word[-1] == 's' and (len(word) < 2 or word[-2] != 's'):
-                base_word = word[:-1]
-                lower_base_word = base_word.lower()
-
-                # Check if the base word (without 's') is in the dictionary
-                if lower_base_word in pi_dictionary and variation in pi_dictionary[lower_base_word]["PI"]:
-                    replacement = pi_dictionary[lower_base_word]["PI"][variation]
-
-                    # Ensure replacement is not None before concatenating 's'
-                    if replacement is not None:
-                        # Preserve case of the original word
-                        if base_word[0].isupper():
-                            replacement = replacement.capitalize()
-                        return replacement + 's'
+            Pattern: The compiled union pattern for the variation.
+        """
+        pattern = self._variation_patterns.get(variation)
+        if pattern is None:
+            # Restrict the union to keys made of word characters only: a
+            # \w+ token can never equal a key containing \W, and entries
+            # like "don't" or the 'desert_2&3' disambiguation meta-key are
+            # not matchable text
+            keys = [key for key in self._get_variation_map(variation)
+                    if not self._NON_WORD_RE.search(key)]
+            keys.sort(key=len, reverse=True)
+            pattern = re.compile(
+                r'\b(?:' + '|'.join(re.escape(key) for key in keys) + r')s?\b',
+                re.IGNORECASE)
+            self._variation_patterns[variation] = pattern
+        return pattern
+
+    @staticmethod
+    def _make_replacement_callback(replacement_dict):
+        """
+        Builds the match callback that replaces a matched word, falling back to the base word without
+        its 's' suffix when there is no exact entry. The replacement map is closed over once so the
+        callback itself is reusable across many sub calls.
+
+        Args:
+            replacement_dict (dict): A map of lowercase words to their PI replacements.
+
+        Returns:
+            Callable: The callback to pass to the union pattern's sub.
+        """
+        match_case = Transcriber._match_case
+        intern = sys.intern
+
+        def replace_or_desuffix(match):
+            word = match.group(0)
+            # Interned lookup keys compare by pointer against the interned
+            # dictionary keys; long words are rare and not worth the probe
+            lower_word = word.lower()
+            if len(lower_word) <= 16:
+                lower_word = intern(lower_word)
+            replacement = replacement_dict.get(lower_word)
+            if replacement is not None:
+                # Preserve case of the original word
+                return match_case(word, replacement)
+
+            # Reject non-candidates with plain character tests before paying
+            # for the slice, the lowercase copy and the map probe
+            if word[-1] != 's' or (len(word) > 1 and word[-2] == 's'):
+                return word
+
+            replacement = replacement_dict.get(word[:-1].lower())
+            if replacement is not None:
+                # Preserve case of the original word
+                if word[0].isupper():
+                    replacement = replacement.capitalize()
+                return replacement + 's'
             return word
 
-        tokens = re.findall(r'\w+|[^\w\s]+|\s+', input_text)
-        updated_tokens = [
-            transform_word(token) if token.strip() != '' else token for token in tokens]
-        return ''.join(updated_tokens)
+        return replace_or_desuffix
 
     def perform_preliminary_replacements(self, input_text):
         """
@@ -129,21 +271,12 @@ class Transcriber:
 
         def replacement_callback(match):
             word = match.group(0)
-            replacement = self.preliminary_replacements[word.lower()]
             # Preserve case of the original word
-            if word.istitle():
-                return replacement.capitalize()
-            elif word.isupper():
-                return replacement.upper()
-            else:
-                return replacement
-
-        # Perform replace operations
-        for word in self.preliminary_replacements:
-            input_text = re.sub(r'\b{}\b'.format(
-                word), replacement_callback, input_text, flags=re.IGNORECASE)
+            return self._match_case(
+                word, self.preliminary_replacements[word.lower()])
 
-        return input_text
+        # Perform all replacements in a single pass with the union pattern
+        return self.preliminary_pattern.sub(replacement_callback, input_text)
 
     def transcribe(self, input_text):
         """
@@ -157,12 +290,54 @@ class Transcriber:
 
 
         """
-        pi_dictionary = self.dictionary.pi_dictionary
-        processed_text = self.replace_words_for_pi_variation(
-            input_text, pi_dictionary)
-        processed_text = self.transform_words_with_s_suffix(
-            processed_text, pi_dictionary, self.variation)
-        return processed_text
+        return self._get_specialized_transcriber()(input_text)
+
+    def _get_specialized_transcriber(self):
+        """
+        Returns the transcription closure specialized for this instance's variation, building it on
+        first use and discarding it whenever the dictionary is refreshed.
+
+        The union pattern's sub and the replacement callback are resolved once and baked into the
+        closure, so each call is a single entry into the regex engine with no per-call cache or
+        attribute lookups.
+
+        Returns:
+            Callable: A function mapping input text to its PI transcription.
+        """
+        specialized = self._specialized_transcribe
+        if specialized is None:
+            sub = self._get_variation_pattern(self.variation).sub
+            callback = self._make_replacement_callback(
+                self._get_variation_map(self.variation))
+
+            def transcribe_specialized(input_text):
+                return sub(callback, input_text)
+
+            specialized = transcribe_specialized
+            self._specialized_transcribe = specialized
+        return specialized
+
+    def transcribe_batch(self, input_texts):
+        """
+        Transcribes a sequence of texts to the PI format in one go.
+
+        The variation map, union pattern and replacement callback are resolved once and bound to locals,
+        so per-document work is reduced to a single sub call instead of repeating the lookup and
+        callback construction for every text.
+
+        Args:
+            input_texts (list[str]): The texts to be transcribed.
+
+        Returns:
+            list[str]: The transcribed texts, in input order.
+        """
+        transcribe = self._get_specialized_transcriber()
+        # Preallocate the result list to its final size and write by index,
+        # avoiding the growth reallocations of an appending loop
+        output_texts = [None] * len(input_texts)
+        for i, input_text in enumerate(input_texts):
+            output_texts[i] = transcribe(input_text)
+        return output_texts
 
     def transcribe_interactively(self, sentences, extension='.txt'):
         """
@@ -187,11 +362,13 @@ class Transcriber:
         """
         variation = self.variation
         current_sentence_index = 0
+        self._words_cache.clear()
+        self._build_word_index(sentences)
 
         # Iterating through sentences
         while current_sentence_index < len(sentences):
             sentence = sentences[current_sentence_index]
-            words = self.split_sentence_into_words(sentence)
+            words = self._get_sentence_words(sentences, current_sentence_index)
             selected_word_index = 0
             enter_action = None
 
@@ -323,7 +500,8 @@ class Transcriber:
                         current_sentence_index = (
                             current_sentence_index - 1 + len(sentences)) % len(sentences)
                         sentence = sentences[current_sentence_index]
-                        words = self.split_sentence_into_words(sentence)
+                        words = self._get_sentence_words(
+                            sentences, current_sentence_index)
                         selected_word_index = len(words) - 1
 
                 # Add/Edit dictionary entry action
@@ -335,9 +513,9 @@ class Transcriber:
                     else:
                         entry_updated = self.dictionary.edit_entry(
                             selected_word)
-                    # Refresh the dictionary after modification
+                    # Refresh the caches for the modified entry
                     if entry_updated:
-                        self.refresh_dictionary()
+                        self.refresh_dictionary(word=selected_word)
 
                     # The word index remains the same, so the user can review changes and decide the next action
 
@@ -354,7 +532,8 @@ class Transcriber:
                         current_sentence_index + (1 if user_action == 'ns' else -1)) % len(sentences)
                     if current_sentence_index < len(sentences):
                         sentence = sentences[current_sentence_index]
-                        words = self.split_sentence_into_words(sentence)
+                        words = self._get_sentence_words(
+                            sentences, current_sentence_index)
                         selected_word_index = 0
 
                 # Quit action
@@ -376,7 +555,8 @@ class Transcriber:
                 if word_updated:
                     # Update the current sentence with the latest changes
                     sentence = sentences[current_sentence_index]
-                    words = self.split_sentence_into_words(sentence)
+                    words = self._get_sentence_words(
+                        sentences, current_sentence_index)
 
                     # Find the new position of the updated word or the next word
                     if selected_word in words:
@@ -395,7 +575,8 @@ class Transcriber:
                         current_sentence_index = (
                             current_sentence_index + 1) % len(sentences)
                         sentence = sentences[current_sentence_index]
-                        words = self.split_sentence_into_words(sentence)
+                        words = self._get_sentence_words(
+                            sentences, current_sentence_index)
                         selected_word_index = 0
 
             # end while
@@ -417,12 +598,100 @@ class Transcriber:
         """
         # Simple sentence splitting based on punctuation
         # Consider using more sophisticated methods for complex texts
-        sentences = re.split(
-            r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!|\n)\s', text)
-        return [sentence.strip() for sentence in sentences if sentence.strip()]
+        if self.USE_FAST_SPLIT:
+            sentences = self._split_sentences_scan(text)
+        else:
+            sentences = self._SENTENCE_SPLIT_RE.split(text)
+        # Strip each sentence once and classify the result, instead of
+        # stripping a second time just for the emptiness test
+        stripped_sentences = (sentence.strip() for sentence in sentences)
+        return [sentence for sentence in stripped_sentences if sentence]
 
         # Placeholder function for processing each sentence interactively
 
+    def _build_word_index(self, sentences):
+        """
+        Builds the inverted index mapping each lowercase word to the set of indices of the sentences
+        containing it, so a word replacement only has to visit the sentences where the word occurs.
+
+        Args:
+            sentences (List[str]): The list of sentences being transcribed.
+        """
+        word_index: dict[str, set[int]] = {}
+        for i, sentence in enumerate(sentences):
+            for word in self.split_sentence_into_words(sentence):
+                word_index.setdefault(word.lower(), set()).add(i)
+        self._word_index = word_index
+
+    def _get_sentence_words(self, sentences, index):
+        """
+        Returns the word list for the sentence at the given index, splitting it only on first access.
+
+        Navigating between words and sentences re-reads the same word lists constantly, so they are
+        cached per sentence index; the cache is invalidated whenever a sentence is mutated.
+
+        Args:
+            sentences (List[str]): The list of sentences being transcribed.
+            index (int): The index of the sentence to get the words for.
+
+        Returns:
+            List[str]: The words of the sentence at the given index.
+        """
+        words = self._words_cache.get(index)
+        if words is None:
+            words = self.split_sentence_into_words(sentences[index])
+            self._words_cache[index] = words
+        return words
+
+    @staticmethod
+    def _is_word_char(char):
+        """
+        Tests whether a character counts as a word character (\\w) for the abbreviation rules.
+        """
+        return char.isalnum() or char == '_'
+
+    @classmethod
+    def _split_sentences_scan(cls, text):
+        """
+        Splits text at sentence boundaries with a single forward scan.
+
+        Walks the string once and cuts at every whitespace character preceded by a terminator,
+        applying the two abbreviation exceptions of the regex splitter ('D.C. ', 'Mr. ') by direct
+        indexing — one deterministic O(n) pass with no lookbehinds or backtracking.
+
+        Args:
+            text (str): The text to be split.
+
+        Returns:
+            List[str]: The raw sentence pieces, separators removed.
+        """
+        sentences = []
+        append_sentence = sentences.append
+        start = 0
+        for i in range(1, len(text)):
+            # str.isspace() also accepts the \x1c-\x1f separator controls,
+            # which \s (Unicode White_Space) does not match — and \x1e is
+            # the join sentinel of replace_word_in_all_sentences
+            char = text[i]
+            if not char.isspace() or '\x1c' <= char <= '\x1f':
+                continue
+            if text[i - 1] not in '.?!\n':
+                continue
+            # Abbreviation like 'Mr.' — equivalent of (?<![A-Z][a-z]\.)
+            if (i >= 3 and text[i - 1] == '.'
+                    and 'A' <= text[i - 3] <= 'Z' and 'a' <= text[i - 2] <= 'z'):
+                continue
+            # Initialism like 'D.C.' — equivalent of (?<!\w\.\w.); the
+            # lookbehind's trailing dot never matches a newline terminator
+            if (i >= 4 and text[i - 1] != '\n' and text[i - 3] == '.'
+                    and cls._is_word_char(text[i - 4])
+                    and cls._is_word_char(text[i - 2])):
+                continue
+            append_sentence(text[start:i])
+            start = i + 1
+        append_sentence(text[start:])
+        return sentences
+
     def rejoin_sentences(self, sentences):
         """
         Reassembles a list of sentences back into a single text string.
@@ -445,11 +714,19 @@ class Transcriber:
         Returns:
             List[str]: A list of words from the sentence.
         """
-        # Correctly escape or position the hyphen in the character class
-        cleaned_sentence = re.sub(r'^[+#*\s-]+', '', sentence)
+        # Slice the leading markup off directly; sub would allocate a copy
+        # of the sentence even when there is nothing to remove
+        marks_match = self._LEADING_MARKS_RE.match(sentence)
+        cleaned_sentence = sentence[marks_match.end():] if marks_match \
+            else sentence
+
+        # Fast path for ASCII sentences: classify characters through the
+        # translation table and split on the resulting spaces
+        if cleaned_sentence.isascii():
+            return cleaned_sentence.translate(self._ASCII_WORD_TABLE).split()
 
         # Split the sentence into words based on spaces and punctuation, preserving words with diacritics
-        words = re.findall(r'[\p{L}\p{M}]+', cleaned_sentence, re.UNICODE)
+        words = self._WORD_RE.findall(cleaned_sentence)
         return words
 
     def highlight_selected_word(self, sentence, selected_word):
@@ -463,12 +740,26 @@ class Transcriber:
         Returns:
             str: The sentence with the highlighted word.
         """
+        # Locate the first whole-word occurrence with plain string scanning
+        # on the UI hot path; ASCII boundaries are simple character tests
+        if sentence.isascii():
+            word_length = len(selected_word)
+            i = sentence.find(selected_word)
+            while i != -1:
+                end = i + word_length
+                if ((i == 0 or not self._is_word_char(sentence[i - 1]))
+                        and (end == len(sentence)
+                             or not self._is_word_char(sentence[end]))):
+                    return f'{sentence[:i]}>{selected_word}<{sentence[end:]}'
+                i = sentence.find(selected_word, i + 1)
+            return sentence
+
         def replace(match):
             return f'>{match.group(0)}<'
 
         # Use a regular expression to replace only whole words
-        highlighted_sentence = re.sub(
-            rf'\b{re.escape(selected_word)}\b', replace, sentence, count=1)
+        highlighted_sentence = self._compile_word_pattern(
+            selected_word).sub(replace, sentence, count=1)
         return highlighted_sentence
 
     def replace_word_in_sentence(self, sentence, word, replacement):
@@ -485,17 +776,11 @@ class Transcriber:
         """
         def replace(match):
             # Preserve case of the original word
-            matched_word = match.group(0)
-            if matched_word.isupper():
-                return replacement.upper()
-            elif matched_word.istitle():
-                return replacement.capitalize()
-            else:
-                return replacement
+            return self._match_case(match.group(0), replacement)
 
         # Use regular expression to replace only whole words, case-insensitively
-        pattern = rf'\b{re.escape(word)}\b'
-        return re.sub(pattern, replace, sentence, flags=re.IGNORECASE)
+        pattern = self._compile_word_pattern(word, ignore_case=True)
+        return pattern.sub(replace, sentence)
 
     def replace_word_in_all_sentences(self, sentences, original_word, new_word):
         """
@@ -512,7 +797,26 @@ class Transcriber:
         if original_word == new_word:
             return
 
-        # pylint: disable=consider-using-enumerate
-        for i in range(len(sentences)):  # type: ignore
-            sentences[i] = self.replace_word_in_sentence(
-                sentences[i], original_word, new_word)
+        # With the inverted index, only visit the sentences that actually
+        # contain the word and keep the index current for those sentences
+        if self._word_index is not None:
+            indices = self._word_index.pop(original_word.lower(), None)
+            if not indices:
+                return
+            for i in sorted(indices):
+                sentences[i] = self.replace_word_in_sentence(
+                    sentences[i], original_word, new_word)
+                self._words_cache.pop(i, None)
+                for word in self.split_sentence_into_words(sentences[i]):
+                    self._word_index.setdefault(word.lower(), set()).add(i)
+            return
+
+        # Run a single regex pass over the joined text instead of one pass
+        # per sentence; the record separator never occurs in normal text
+        joined_text = '\x1e'.join(sentences)
+        joined_text = self.replace_word_in_sentence(
+            joined_text, original_word, new_word)
+        sentences[:] = joined_text.split('\x1e')
+
+        # The sentences changed, so the cached word lists are stale
+        self._words_cache.clear()